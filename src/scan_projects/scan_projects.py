@@ -3,32 +3,83 @@
 import os
 import time
 import json
-from datetime import datetime
+import shutil
 import subprocess
-from pathlib import Path
+import sys
+import tempfile
+import tomllib
 import argparse
 from typing import Dict, List, Optional
-from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+_GIT = shutil.which('git')
+
+CACHE_PATH = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                          'scan_projects', 'index.json')
+
+# Bump whenever the layout of cached entries changes; older indexes are dropped
+CACHE_VERSION = 2
+
+# Top-level files, and files inside .git, whose mtimes decide together with
+# the directory's own mtime whether a cached entry is still valid
+_STAMP_FILES = ('pyproject.toml', 'package.json', 'uv.lock', 'poetry.lock',
+                'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml')
+_STAMP_GIT_FILES = ('HEAD', 'index')
+
+# Directories modified more recently than this are not walked
+RECENT_SECONDS = 300
+
+# Directories that hold tooling, dependencies or build output rather than
+# user edits; they are skipped when looking for the last modification.
+_IGNORE = frozenset({
+    '.git', 'node_modules', '.venv', 'venv', '__pycache__', '.mypy_cache',
+    '.pytest_cache', 'dist', 'build', '.tox', 'target', '.next',
+})
+
+def _iter_mtimes_ns(path: str):
+    """Yield the modification time in nanoseconds of every file below path."""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _IGNORE:
+                            yield from _iter_mtimes_ns(entry.path)
+                    else:
+                        yield entry.stat(follow_symlinks=False).st_mtime_ns
+                except OSError:
+                    continue
+    except OSError:
+        return
 
 def get_last_modified(path: str) -> float:
     """Get the last modification time of any file in the directory."""
-    latest = 0
-    for root, _, files in os.walk(path):
-        for file in files:
-            file_path = os.path.join(root, file)
-            try:
-                mtime = os.path.getmtime(file_path)
-                latest = max(latest, mtime)
-            except OSError:
-                continue
-    return latest
-
-def format_time_ago(timestamp: float) -> str:
+    # A directory touched in the last few minutes already sorts at the top,
+    # so its own mtime is close enough and the deep walk is skipped.
+    try:
+        top_mtime = os.stat(path).st_mtime
+    except OSError:
+        return 0
+    if time.time() - top_mtime < RECENT_SECONDS:
+        return top_mtime
+    # Compare integer nanoseconds and convert to seconds once at the end
+    return max(_iter_mtimes_ns(path), default=0) / 1e9
+
+def format_time_ago(timestamp: float, now: Optional[float] = None) -> str:
     """Format the time difference between now and the timestamp."""
     if timestamp == 0:
         return "Never modified"
     
-    diff = time.time() - timestamp
+    if now is None:
+        now = time.time()
+    diff = now - timestamp
     if diff < 60:
         return "Just now"
     elif diff < 3600:
@@ -43,60 +94,82 @@ def format_time_ago(timestamp: float) -> str:
 
 def is_git_repo(path: str) -> bool:
     """Check if directory is a git repository."""
+    # A work tree has a .git directory (or a .git file for worktrees and
+    # submodules); a bare repository keeps objects/ and refs/ at its root.
+    try:
+        os.lstat(os.path.join(path, '.git'))
+        return True
+    except OSError:
+        pass
+    return (os.path.isdir(os.path.join(path, 'objects')) and
+            os.path.isdir(os.path.join(path, 'refs')))
+
+def _inside_git_work_tree(path: str) -> bool:
+    """Ask git whether the directory lies inside a work tree."""
+    if _GIT is None:
+        return False
     try:
-        result = subprocess.run(['git', 'rev-parse', '--is-inside-work-tree'],
-                              cwd=path,
-                              stdout=subprocess.PIPE,
-                              stderr=subprocess.PIPE)
-        return result.returncode == 0
-    except FileNotFoundError:
+        result = subprocess.run([_GIT, '-C', path, 'rev-parse', '--is-inside-work-tree'],
+                                stdin=subprocess.DEVNULL,
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL,
+                                check=False)
+    except OSError:
         return False
+    return result.returncode == 0
 
-def get_python_version(path: str) -> Optional[str]:
+def _list_names(path: str) -> Dict[str, str]:
+    """Map the names of the entries at the top of the directory to their paths."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry.path for entry in entries}
+    except OSError:
+        return {}
+
+def _load_pyproject(path: str) -> Dict:
+    """Parse pyproject.toml from the directory, or {} if it cannot be read."""
+    try:
+        with open(os.path.join(path, "pyproject.toml"), 'rb') as f:
+            return tomllib.load(f)
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError):
+        return {}
+
+def get_python_version(path: str, pyproject: Optional[Dict] = None) -> Optional[str]:
     """Try to detect Python version from pyproject.toml."""
-    pyproject_path = os.path.join(path, "pyproject.toml")
-    if os.path.exists(pyproject_path):
-        try:
-            with open(pyproject_path) as f:
-                for line in f:
-                    if "requires-python" in line:
-                        return line.split("=")[-1].strip().strip('"')
-        except:
-            pass
-    return None
+    if pyproject is None:
+        pyproject = _load_pyproject(path)
+    try:
+        version = pyproject.get('project', {}).get('requires-python')
+        if not (isinstance(version, str) and version):
+            version = pyproject.get('tool', {}).get('poetry', {}).get('dependencies', {}).get('python')
+    except AttributeError:
+        return None
+    # Only plain strings are version specifiers; tables, arrays and numbers
+    # would break counting and sorting further down.
+    return version if isinstance(version, str) and version else None
 
-def check_project_environment(path: str) -> Dict[str, bool]:
+def check_project_environment(path: str, pyproject: Optional[Dict] = None,
+                              names: Optional[Dict[str, str]] = None) -> Dict[str, bool]:
     """Check if directory has a managed development environment."""
-    # Python-related files
-    pyproject_path = os.path.join(path, "pyproject.toml")
-    uv_lock_path = os.path.join(path, "uv.lock")
-    poetry_lock_path = os.path.join(path, "poetry.lock")
-    venv_path = os.path.join(path, ".venv")
-    
-    # Node.js/JavaScript-related files
-    package_json_path = os.path.join(path, "package.json")
-    node_modules_path = os.path.join(path, "node_modules")
-    package_lock_path = os.path.join(path, "package-lock.json")
-    yarn_lock_path = os.path.join(path, "yarn.lock")
-    pnpm_lock_path = os.path.join(path, "pnpm-lock.yaml")
-    
+    # A single directory listing answers every existence check below
+    if names is None:
+        names = _list_names(path)
+
     is_poetry = False
     node_package_info = {}
     
     # Check for Poetry in pyproject.toml
-    if os.path.exists(pyproject_path):
-        try:
-            with open(pyproject_path) as f:
-                content = f.read()
-                is_poetry = "tool.poetry" in content
-        except:
-            pass
+    if 'pyproject.toml' in names:
+        if pyproject is None:
+            pyproject = _load_pyproject(path)
+        tool = pyproject.get('tool')
+        is_poetry = isinstance(tool, dict) and 'poetry' in tool
     
     # Get Node.js package info
-    if os.path.exists(package_json_path):
+    if 'package.json' in names:
         try:
-            with open(package_json_path) as f:
-                package_data = json.load(f)
+            with open(names['package.json'], 'rb') as f:
+                package_data = _json_loads(f.read())
                 node_package_info = {
                     'name': package_data.get('name', ''),
                     'version': package_data.get('version', ''),
@@ -109,18 +182,18 @@ def check_project_environment(path: str) -> Dict[str, bool]:
 
     return {
         # Python environment info
-        'has_pyproject': os.path.exists(pyproject_path),
-        'has_uv_lock': os.path.exists(uv_lock_path),
-        'has_poetry_lock': os.path.exists(poetry_lock_path),
-        'has_venv': os.path.exists(venv_path),
+        'has_pyproject': 'pyproject.toml' in names,
+        'has_uv_lock': 'uv.lock' in names,
+        'has_poetry_lock': 'poetry.lock' in names,
+        'has_venv': '.venv' in names,
         'is_poetry': is_poetry,
         
         # Node.js environment info
-        'has_package_json': os.path.exists(package_json_path),
-        'has_node_modules': os.path.exists(node_modules_path),
-        'has_package_lock': os.path.exists(package_lock_path),
-        'has_yarn_lock': os.path.exists(yarn_lock_path),
-        'has_pnpm_lock': os.path.exists(pnpm_lock_path),
+        'has_package_json': 'package.json' in names,
+        'has_node_modules': 'node_modules' in names,
+        'has_package_lock': 'package-lock.json' in names,
+        'has_yarn_lock': 'yarn.lock' in names,
+        'has_pnpm_lock': 'pnpm-lock.yaml' in names,
         'node_info': node_package_info
     }
 
@@ -150,78 +223,209 @@ def determine_project_type(env_info: Dict) -> List[str]:
     
     return types if types else ['Unknown']
 
-def scan_projects(directory: str) -> List[Dict]:
-    """Scan the directory for projects and their information."""
-    projects = []
-    
+def load_cache(path: str = CACHE_PATH) -> Dict:
+    """Load the project index written by a previous scan."""
     try:
-        for item in os.listdir(directory):
-            full_path = os.path.join(directory, item)
-            if os.path.isdir(full_path):
-                last_modified = get_last_modified(full_path)
-                is_git = is_git_repo(full_path)
-                env_info = check_project_environment(full_path)
-                python_version = get_python_version(full_path)
-                
-                projects.append({
-                    'name': item,
-                    'path': full_path,
-                    'last_modified': last_modified,
-                    'last_modified_fmt': format_time_ago(last_modified),
-                    'is_git': is_git,
-                    'python_version': python_version,
-                    'environment_info': env_info
-                })
-        
-        # Sort projects by last modification time (most recent first)
-        return sorted(projects, key=lambda x: x['last_modified'], reverse=True)
-    
+        with open(path) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict) or index.get('version') != CACHE_VERSION:
+        return {}
+    projects = index.get('projects')
+    return projects if isinstance(projects, dict) else {}
+
+def save_cache(cache: Dict, path: str = CACHE_PATH) -> None:
+    """Write the project index for the next scan to reuse."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(path),
+                                         suffix='.tmp', delete=False) as f:
+            json.dump({'version': CACHE_VERSION, 'projects': cache}, f)
+        os.replace(f.name, path)
+    except OSError:
+        pass
+
+# Fields produced by _probe_project and check_project_environment; cached
+# entries lacking any of them are rescanned. The environment keys are taken
+# from a call on a path that cannot be listed, so they never drift.
+_PROBE_FIELDS = ('last_modified', 'is_git', 'python_version', 'environment_info')
+_ENV_FIELDS = frozenset(check_project_environment(os.devnull, {}))
+
+def _is_valid_entry(cached) -> bool:
+    """Check that a cached entry has every field a fresh probe would have."""
+    return (isinstance(cached, dict) and
+            all(field in cached for field in _PROBE_FIELDS) and
+            isinstance(cached['environment_info'], dict) and
+            _ENV_FIELDS <= cached['environment_info'].keys())
+
+def _cache_stamp(full_path: str, names: Dict[str, str]) -> Dict[str, int]:
+    """Collect the mtimes that decide whether a cached entry is still valid."""
+    paths = {'.': full_path}
+    paths.update((name, names[name]) for name in _STAMP_FILES if name in names)
+    if '.git' in names:
+        paths.update((f".git/{name}", os.path.join(names['.git'], name))
+                     for name in _STAMP_GIT_FILES)
+    stamp = {}
+    for name, stamp_path in paths.items():
+        try:
+            stamp[name] = os.stat(stamp_path).st_mtime_ns
+        except OSError:
+            continue
+    return stamp
+
+def _probe_project(full_path: str, in_work_tree: bool,
+                   names: Optional[Dict[str, str]] = None) -> Dict:
+    """Run the filesystem probes for a single project directory."""
+    # The directory listing and parsed pyproject.toml are shared by the
+    # detectors, and pyproject.toml is only opened when the listing shows it.
+    if names is None:
+        names = _list_names(full_path)
+    pyproject = _load_pyproject(full_path) if 'pyproject.toml' in names else {}
+    return {
+        'last_modified': get_last_modified(full_path),
+        'is_git': in_work_tree or is_git_repo(full_path),
+        'python_version': get_python_version(full_path, pyproject),
+        'environment_info': check_project_environment(full_path, pyproject, names)
+    }
+
+def _inspect_project(full_path: str, name: str, in_work_tree: bool = False,
+                     cache: Optional[Dict] = None, now: Optional[float] = None) -> Dict:
+    """Collect the information shown for a single project directory."""
+    if cache is not None:
+        # A cached entry is reused while the directory's own mtime, the
+        # mtimes of its top-level manifests and lock files, and those of
+        # .git/HEAD and .git/index are unchanged. Other edits, such as
+        # uncommitted changes to source files, are missed, so the cache
+        # trades freshness for speed and is opt-in.
+        key = os.path.abspath(full_path)
+        names = _list_names(full_path)
+        stamp = _cache_stamp(full_path, names)
+        cached = cache.get(key)
+        if _is_valid_entry(cached) and cached.get('stamp') == stamp:
+            probe = cached
+        else:
+            probe = _probe_project(full_path, in_work_tree, names)
+            cache[key] = dict(probe, stamp=stamp)
+    else:
+        probe = _probe_project(full_path, in_work_tree)
+
+    project_types = determine_project_type(probe['environment_info'])
+
+    return {
+        'name': name,
+        'path': full_path,
+        'last_modified': probe['last_modified'],
+        'last_modified_fmt': format_time_ago(probe['last_modified'], now),
+        'is_git': probe['is_git'],
+        'python_version': probe['python_version'],
+        'environment_info': probe['environment_info'],
+        'project_types': project_types,
+        'project_types_str': ','.join(project_types)
+    }
+
+def scan_projects(directory: str, cache: Optional[Dict] = None) -> List[Dict]:
+    """Scan the directory for projects and their information.
+
+    If cache is given, unchanged projects are taken from it and it is
+    updated in place with the results of this scan.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            dirs = [entry for entry in entries if entry.is_dir()]
     except PermissionError:
         print(f"Error: Permission denied accessing {directory}")
         return []
 
+    if cache is not None:
+        # Forget projects under this directory that no longer exist
+        root = os.path.abspath(directory)
+        visited = {os.path.abspath(entry.path) for entry in dirs}
+        for key in [k for k in cache if os.path.dirname(k) == root and k not in visited]:
+            del cache[key]
+
+    if not dirs:
+        return []
+
+    # Projects without their own .git still belong to a repository when the
+    # scanned directory is itself inside one; git is asked once per scan.
+    in_work_tree = _inside_git_work_tree(directory)
+
+    # Each project is inspected independently and mostly waits on the
+    # filesystem, so the work is spread over a pool of threads.
+    with ThreadPoolExecutor(max_workers=min(32, len(dirs))) as executor:
+        projects = list(executor.map(partial(_inspect_project, in_work_tree=in_work_tree,
+                                             cache=cache, now=time.time()),
+                                     [entry.path for entry in dirs],
+                                     [entry.name for entry in dirs]))
+
+    # Sort projects by last modification time (most recent first)
+    return sorted(projects, key=lambda x: x['last_modified'], reverse=True)
+
 def get_project_statistics(projects: List[Dict]) -> Dict:
     """Calculate statistics about the projects."""
     stats = {
         'total': len(projects),
-        'git_repos': sum(1 for p in projects if p['is_git']),
-        'python_versions': Counter(p['python_version'] for p in projects if p['python_version']),
-        'uv_managed': sum(1 for p in projects if p['environment_info']['has_uv_lock']),
-        'poetry_managed': sum(1 for p in projects if p['environment_info']['is_poetry']),
-        'node_projects': sum(1 for p in projects if p['environment_info']['has_package_json']),
-        'typescript_projects': sum(1 for p in projects if p['environment_info']['node_info'].get('has_typescript')),
+        'git_repos': 0,
+        'python_versions': {},
+        'uv_managed': 0,
+        'poetry_managed': 0,
+        'node_projects': 0,
+        'typescript_projects': 0,
         'package_managers': {
-            'npm': sum(1 for p in projects if p['environment_info']['has_package_lock']),
-            'yarn': sum(1 for p in projects if p['environment_info']['has_yarn_lock']),
-            'pnpm': sum(1 for p in projects if p['environment_info']['has_pnpm_lock'])
+            'npm': 0,
+            'yarn': 0,
+            'pnpm': 0
         }
     }
+    python_versions = stats['python_versions']
+    package_managers = stats['package_managers']
+
+    # Every counter is updated in a single pass over the projects
+    for p in projects:
+        env = p['environment_info']
+        stats['git_repos'] += p['is_git']
+        version = p['python_version']
+        if version:
+            python_versions[version] = python_versions.get(version, 0) + 1
+        stats['uv_managed'] += env['has_uv_lock']
+        stats['poetry_managed'] += env['is_poetry']
+        stats['node_projects'] += env['has_package_json']
+        stats['typescript_projects'] += bool(env['node_info'].get('has_typescript'))
+        package_managers['npm'] += env['has_package_lock']
+        package_managers['yarn'] += env['has_yarn_lock']
+        package_managers['pnpm'] += env['has_pnpm_lock']
     return stats
 
-def print_project_statistics(stats: Dict):
-    """Print statistics about the projects."""
-    print("\nProject Statistics:")
-    print("-" * 70)
-    print(f"Total projects: {stats['total']}")
-    print(f"Git repositories: {stats['git_repos']}")
-    
-    print("\nPython Projects:")
-    print(f"  UV-managed: {stats['uv_managed']}")
-    print(f"  Poetry-managed: {stats['poetry_managed']}")
-    
-    print("\nNode.js Projects:")
-    print(f"  Total Node.js projects: {stats['node_projects']}")
-    print(f"  TypeScript projects: {stats['typescript_projects']}")
-    print("  Package Managers:")
-    print(f"    npm: {stats['package_managers']['npm']}")
-    print(f"    yarn: {stats['package_managers']['yarn']}")
-    print(f"    pnpm: {stats['package_managers']['pnpm']}")
+def format_project_statistics(stats: Dict) -> List[str]:
+    """Format statistics about the projects as output lines."""
+    lines = [
+        "",
+        "Project Statistics:",
+        "-" * 70,
+        f"Total projects: {stats['total']}",
+        f"Git repositories: {stats['git_repos']}",
+        "",
+        "Python Projects:",
+        f"  UV-managed: {stats['uv_managed']}",
+        f"  Poetry-managed: {stats['poetry_managed']}",
+        "",
+        "Node.js Projects:",
+        f"  Total Node.js projects: {stats['node_projects']}",
+        f"  TypeScript projects: {stats['typescript_projects']}",
+        "  Package Managers:",
+        f"    npm: {stats['package_managers']['npm']}",
+        f"    yarn: {stats['package_managers']['yarn']}",
+        f"    pnpm: {stats['package_managers']['pnpm']}",
+    ]
     
     if stats['python_versions']:
-        print("\nPython versions used:")
+        lines.append("")
+        lines.append("Python versions used:")
         for version, count in stats['python_versions'].items():
             if version:
-                print(f"  Python {version}: {count} projects")
+                lines.append(f"  Python {version}: {count} projects")
+    return lines
 
 def main() -> None:
     parser = argparse.ArgumentParser(description='Scan project directory for recent activity')
@@ -242,6 +446,9 @@ def main() -> None:
     parser.add_argument('--sort', choices=['date', 'name', 'python', 'type'],
                        default='date',
                        help='Sort projects by date, name, Python version, or project type')
+    parser.add_argument('--cache', action='store_true',
+                       help='Reuse results for projects whose top-level directory is unchanged '
+                            f'(stored in {CACHE_PATH})')
     
     args = parser.parse_args()
     directory = os.path.expanduser(args.directory)
@@ -251,19 +458,25 @@ def main() -> None:
         return
     
     print(f"\nScanning directory: {directory}\n")
-    projects = scan_projects(directory)
+    cache = load_cache() if args.cache else None
+    projects = scan_projects(directory, cache)
+    if cache is not None:
+        save_cache(cache)
     
-    # Apply filters
+    # Apply filters in a single pass
+    filters = []
     if args.uv_only:
-        projects = [p for p in projects if p['environment_info']['has_uv_lock']]
+        filters.append(lambda p: p['environment_info']['has_uv_lock'])
     if args.poetry_only:
-        projects = [p for p in projects if p['environment_info']['is_poetry']]
+        filters.append(lambda p: p['environment_info']['is_poetry'])
     if args.node_only:
-        projects = [p for p in projects if p['environment_info']['has_package_json']]
+        filters.append(lambda p: p['environment_info']['has_package_json'])
     if args.typescript_only:
-        projects = [p for p in projects if p['environment_info']['node_info'].get('has_typescript')]
+        filters.append(lambda p: p['environment_info']['node_info'].get('has_typescript'))
     if args.git_only:
-        projects = [p for p in projects if p['is_git']]
+        filters.append(lambda p: p['is_git'])
+    if filters:
+        projects = [p for p in projects if all(f(p) for f in filters)]
     
     # Apply sorting
     if args.sort == 'name':
@@ -271,7 +484,7 @@ def main() -> None:
     elif args.sort == 'python':
         projects.sort(key=lambda x: (x['python_version'] or '', x['name'].lower()))
     elif args.sort == 'type':
-        projects.sort(key=lambda x: str(determine_project_type(x['environment_info'])))
+        projects.sort(key=itemgetter('project_types_str'))
     
     if args.limit:
         projects = projects[:args.limit]
@@ -280,13 +493,11 @@ def main() -> None:
         print("No projects found.")
         return
     
-    # Print results
-    print("Recent Projects:")
-    print("-" * 70)
+    # Collect the report and write it out in one go
+    out = ["Recent Projects:", "-" * 70]
     for project in projects:
         git_status = "[Git]" if project['is_git'] else "[No Git]"
-        project_types = determine_project_type(project['environment_info'])
-        type_str = f"[{', '.join(project_types)}]"
+        type_str = f"[{', '.join(project['project_types'])}]"
         
         env_status = []
         node_info = project['environment_info']['node_info']
@@ -309,15 +520,16 @@ def main() -> None:
         env_str = f"[{', '.join(env_status)}]" if env_status else "[No Package Manager]"
         python_ver = f"[Python {project['python_version']}]" if project['python_version'] else ""
         
-        print(f"{project['name']} {git_status} {type_str}")
-        print(f"Environment: {env_str} {python_ver}")
-        print(f"Last modified: {project['last_modified_fmt']}")
-        print(f"Path: {project['path']}")
-        print("-" * 70)
+        out.append(f"{project['name']} {git_status} {type_str}")
+        out.append(f"Environment: {env_str} {python_ver}")
+        out.append(f"Last modified: {project['last_modified_fmt']}")
+        out.append(f"Path: {project['path']}")
+        out.append("-" * 70)
     
-    # Print statistics
+    # Add statistics
     stats = get_project_statistics(projects)
-    print_project_statistics(stats)
+    out.extend(format_project_statistics(stats))
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
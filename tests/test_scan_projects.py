@@ -0,0 +1,126 @@
+import json
+import os
+
+from scan_projects.scan_projects import (CACHE_VERSION, check_project_environment,
+                                         get_last_modified, get_python_version, load_cache,
+                                         save_cache, scan_projects)
+
+
+def write_pyproject(tmp_path, content):
+    (tmp_path / "pyproject.toml").write_text(content)
+    return str(tmp_path)
+
+
+def test_python_version_from_project_table(tmp_path):
+    path = write_pyproject(tmp_path, '[project]\nrequires-python = ">=3.11, <3.13"\n')
+    assert get_python_version(path) == ">=3.11, <3.13"
+
+
+def test_python_version_from_poetry_dependencies(tmp_path):
+    path = write_pyproject(tmp_path, '[tool.poetry.dependencies]\npython = "^3.9"\n')
+    assert get_python_version(path) == "^3.9"
+
+
+def test_python_version_ignores_non_string_values():
+    assert get_python_version("", {'project': {'requires-python': ["3.9"]}}) is None
+    assert get_python_version("", {'project': {'requires-python': 3.11}}) is None
+    pyproject = {'tool': {'poetry': {'dependencies': {'python': {'version': "^3.9"}}}}}
+    assert get_python_version("", pyproject) is None
+
+
+def test_poetry_detected_from_tool_table(tmp_path):
+    path = write_pyproject(tmp_path, '[tool]\npoetry = {name = "demo"}\n')
+    assert check_project_environment(path)['is_poetry']
+
+
+def test_poetry_not_detected_from_comments_or_other_tables(tmp_path):
+    path = write_pyproject(tmp_path, '# migrated away from [tool.poetry] to uv\n'
+                                     '[tool.poetry-dynamic-versioning]\nenable = true\n')
+    assert not check_project_environment(path)['is_poetry']
+
+
+def make_project(root, name, package_json='{}'):
+    project = root / name
+    project.mkdir()
+    (project / "package.json").write_text(package_json)
+    return str(project)
+
+
+def test_cache_reuses_unchanged_projects(tmp_path):
+    key = make_project(tmp_path, "app")
+    cache = {}
+    scan_projects(str(tmp_path), cache)
+    cache[key]['last_modified'] = 1.0
+
+    [project] = scan_projects(str(tmp_path), cache)
+    assert project['last_modified'] == 1.0
+
+
+def test_cache_rescans_when_manifest_changes(tmp_path):
+    key = make_project(tmp_path, "app")
+    cache = {}
+    scan_projects(str(tmp_path), cache)
+
+    manifest = tmp_path / "app" / "package.json"
+    manifest.write_text('{"devDependencies": {"typescript": "5"}}')
+    mtime_ns = cache[key]['stamp']['package.json'] + 1_000_000_000
+    os.utime(manifest, ns=(mtime_ns, mtime_ns))
+
+    [project] = scan_projects(str(tmp_path), cache)
+    assert project['project_types'] == ['TypeScript (npm)']
+
+
+def test_cache_rescans_incomplete_entries(tmp_path):
+    key = make_project(tmp_path, "app")
+    cache = {}
+    scan_projects(str(tmp_path), cache)
+    del cache[key]['environment_info']['has_pnpm_lock']
+
+    [project] = scan_projects(str(tmp_path), cache)
+    assert project['project_types'] == ['JavaScript (npm)']
+    assert 'has_pnpm_lock' in cache[key]['environment_info']
+
+
+def test_cache_drops_projects_that_disappeared(tmp_path):
+    make_project(tmp_path, "kept")
+    gone = make_project(tmp_path, "gone")
+    elsewhere = str(tmp_path.parent / "elsewhere" / "app")
+    cache = {elsewhere: {}}
+    scan_projects(str(tmp_path), cache)
+    os.remove(os.path.join(gone, "package.json"))
+    os.rmdir(gone)
+
+    scan_projects(str(tmp_path), cache)
+    assert gone not in cache
+    assert str(tmp_path / "kept") in cache
+    assert elsewhere in cache
+
+
+def test_cache_round_trip(tmp_path):
+    make_project(tmp_path, "app")
+    cache = {}
+    scan_projects(str(tmp_path), cache)
+    path = str(tmp_path / "cache" / "index.json")
+
+    save_cache(cache, path=path)
+    assert load_cache(path=path) == cache
+    assert os.listdir(tmp_path / "cache") == ["index.json"]
+
+
+def test_load_cache_drops_other_versions(tmp_path):
+    path = tmp_path / "index.json"
+    path.write_text(json.dumps({'version': CACHE_VERSION - 1, 'projects': {'/app': {}}}))
+    assert load_cache(path=str(path)) == {}
+    path.write_text(json.dumps({'/app': {}}))
+    assert load_cache(path=str(path)) == {}
+
+
+def test_last_modified_counts_files_named_like_ignored_directories(tmp_path):
+    (tmp_path / "build").write_text("#!/bin/sh\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.js").write_text("")
+    os.utime(tmp_path / "build", (2_000_000_000, 2_000_000_000))
+    os.utime(tmp_path / "node_modules" / "dep.js", (2_100_000_000, 2_100_000_000))
+    os.utime(tmp_path, (1_000_000_000, 1_000_000_000))
+
+    assert get_last_modified(str(tmp_path)) == 2_000_000_000